@@ -29,35 +29,39 @@ Usage:
 """
 
 import argparse
+import fnmatch
+import hashlib
 import json
 import os
+import re
+import shutil
+import stat
+import subprocess
 import sys
 import tarfile
-import tempfile
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, UTC
 from pathlib import Path
+from urllib.parse import quote, urlparse, urlunparse
 
 # Third-party imports
+# boto3, requests and python-dotenv are imported where they are first used: boto3
+# alone takes hundreds of milliseconds to import, which --help and argument
+# errors should not pay for. botocore.exceptions is cheap and needed for except clauses.
 try:
-    import boto3
     from botocore.exceptions import ClientError
 except ImportError:
     print("ERROR: boto3 not found. Install with: pip install boto3")
     sys.exit(1)
 
 try:
-    import requests
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    print("ERROR: requests library not found. Install with: pip install requests")
-    sys.exit(1)
-
-try:
-    from dotenv import load_dotenv
-    DOTENV_AVAILABLE = True
-except ImportError:
-    DOTENV_AVAILABLE = False
-    print("WARNING: python-dotenv not found. Install with: pip install python-dotenv")
+    ORJSON_AVAILABLE = False
 
 
 # ============================================================================
@@ -66,6 +70,31 @@ except ImportError:
 
 # Preapproved opportunity types - only opportunities matching these types will be processed
 PREAPPROVED_OPPORTUNITY_TYPES = ["a11y-assistive"]
+_PREAPPROVED_TYPE_SET = frozenset(PREAPPROVED_OPPORTUNITY_TYPES)
+
+# Maximum number of concurrent Spacecat requests (also the HTTP connection pool size)
+MAX_API_WORKERS = 16
+
+# On-disk cache for Spacecat GET responses (disable with --no-cache, clear with --refresh-cache)
+CACHE_DIR = Path.home() / ".cache" / "a11y-autofix"
+CACHE_TTL_SECONDS = 300
+
+# Directories never included in the code archive (dependencies and build caches).
+# .git is kept on purpose: Mystique validates the repository before generating a fix.
+ARCHIVE_EXCLUDED_DIRS = {"node_modules", "__pycache__", ".venv", "venv", ".next", ".turbo", "dist", "build"}
+
+# Multipart S3 upload tuning: parts of this size are uploaded in parallel
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY = 8
+
+# SQS accepts at most 10 entries per send_message_batch call
+SQS_MAX_BATCH_SIZE = 10
+SQS_MAX_BATCH_BYTES = 256 * 1024  # combined body size of one send_message_batch call
+SQS_THROTTLING_ERRORS = frozenset({
+    "Throttling", "ThrottlingException", "RequestThrottled", "AWS.SimpleQueueService.RequestThrottled",
+})
+SQS_BATCH_MAX_ATTEMPTS = 5
+SQS_RETRY_BASE_DELAY = 0.5
 
 
 # ============================================================================
@@ -99,6 +128,38 @@ def print_warning(message: str):
     print(f"⚠ {message}")
 
 
+def uuid7() -> str:
+    """Time-ordered UUIDv7: 48-bit Unix millisecond timestamp followed by random bits"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = bytearray(timestamp_ms.to_bytes(6, "big") + os.urandom(10))
+    value[6] = (value[6] & 0x0F) | 0x70  # version 7
+    value[8] = (value[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(uuid.UUID(bytes=bytes(value)))
+
+
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Encode compact JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# One .env assignment per line: optional `export`, then a double-quoted,
+# single-quoted or bare value; a bare value ends at a ` #` comment.
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:"([^"\r\n]*)"|\'([^\'\r\n]*)\'|([^\r\n]*?))[ \t]*(?:[ \t]#[^\r\n]*)?$',
+    re.MULTILINE,
+)
+
+
 def load_env_file(env_path: str = ".env") -> bool:
     env_file = Path(env_path)
     
@@ -109,7 +170,13 @@ def load_env_file(env_path: str = ".env") -> bool:
         else:
             return False
     
-    if DOTENV_AVAILABLE:
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        load_dotenv = None
+        print_warning("python-dotenv not found. Install with: pip install python-dotenv")
+    
+    if load_dotenv is not None:
         try:
             load_dotenv(env_file, override=True)
             print_success(f"Loaded configuration from {env_file}")
@@ -118,17 +185,10 @@ def load_env_file(env_path: str = ".env") -> bool:
             print_warning(f"Failed to load with python-dotenv: {e}")
 
     try:
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if line.startswith('export '):
-                    line = line[7:]
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    value = value.strip('"').strip("'")
-                    os.environ[key] = value
+        for match in _ENV_LINE_RE.finditer(env_file.read_text()):
+            key, double_quoted, single_quoted, bare = match.groups()
+            os.environ[key] = double_quoted if double_quoted is not None else (
+                single_quoted if single_quoted is not None else bare)
         print_success(f"Loaded configuration from {env_file} (manual parsing)")
         return True
     except Exception as e:
@@ -177,10 +237,57 @@ def validate_config(config: dict) -> bool:
     return True
 
 
+def create_aws_clients(credentials: dict) -> tuple:
+    """Import boto3 on first use and build the S3 and SQS clients from one session"""
+    try:
+        import boto3
+        from botocore.config import Config
+    except ImportError:
+        print("ERROR: boto3 not found. Install with: pip install boto3")
+        sys.exit(1)
+    
+    session = boto3.session.Session(**credentials)
+    client_config = Config(retries={"max_attempts": 3, "mode": "standard"})
+    return session.client("s3", config=client_config), session.client("sqs", config=client_config)
+
+
 # ============================================================================
 # SPACECAT API FUNCTIONS
 # ============================================================================
 
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def get_http_session(config: dict):
+    """
+    Return the shared Spacecat HTTP session (keep-alive + connection pooling).
+
+    The API headers are set on the session once when it is created, so
+    individual requests do not rebuild them.
+    """
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            try:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+            except ImportError:
+                print("ERROR: requests library not found. Install with: pip install requests")
+                sys.exit(1)
+            
+            session = requests.Session()
+            session.headers.update(get_api_headers(config))
+            retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=MAX_API_WORKERS, pool_maxsize=MAX_API_WORKERS,
+                                  max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
 def get_api_headers(config: dict) -> dict:
     return {
         "x-api-key": config["api_key"],
@@ -189,15 +296,93 @@ def get_api_headers(config: dict) -> dict:
     }
 
 
+# Responses already obtained in this process, keyed by URL
+_RESPONSE_MEMO = {}
+
+
+def _cache_path(config: dict, url: str) -> Path:
+    key = hashlib.sha1(f"{config['ims_org_id']}|{url}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _read_cache_entry(cache_file: Path):
+    try:
+        with open(cache_file, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_entry(cache_file: Path, entry: dict):
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        # Responses carry customer suggestion data: keep the file readable by the owner only
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json_dumps(entry))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print_warning(f"Could not write response cache: {e}")
+
+
+def clear_response_cache() -> int:
+    """Delete all cached Spacecat responses, returning the number of entries removed"""
+    _RESPONSE_MEMO.clear()
+    removed = 0
+    if CACHE_DIR.exists():
+        for cache_file in CACHE_DIR.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def spacecat_get(config: dict, url: str, timeout: int):
+    """
+    GET a Spacecat URL and return the decoded JSON body.
+
+    Responses are memoized in-process and cached on disk keyed by URL.
+    Disk entries younger than CACHE_TTL_SECONDS are served without a
+    request; older entries are revalidated with If-None-Match and reused
+    on a 304.
+    """
+    use_cache = config.get("use_cache", True)
+    if use_cache and url in _RESPONSE_MEMO:
+        return _RESPONSE_MEMO[url]
+    
+    cache_file = _cache_path(config, url)
+    entry = _read_cache_entry(cache_file) if use_cache else None
+    
+    if entry and time.time() - entry.get("fetched_at", 0) < CACHE_TTL_SECONDS:
+        _RESPONSE_MEMO[url] = entry["body"]
+        return entry["body"]
+    
+    headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else None
+    response = get_http_session(config).get(url, headers=headers, timeout=timeout)
+    if entry and response.status_code == 304:
+        body = entry["body"]
+    else:
+        response.raise_for_status()
+        body = json_loads(response.content)
+    
+    if use_cache:
+        _write_cache_entry(cache_file, {
+            "url": url,
+            "etag": response.headers.get("ETag") or (entry or {}).get("etag"),
+            "fetched_at": time.time(),
+            "body": body,
+        })
+        _RESPONSE_MEMO[url] = body
+    
+    return body
+
+
 def fetch_all_sites(config: dict) -> list:
     url = f"{config['spacecat_api_base']}/sites"
-    headers = get_api_headers(config)
     
     try:
         print_info("Fetching sites from Spacecat...")
-        response = requests.get(url, headers=headers, timeout=60)
-        response.raise_for_status()
-        sites = response.json()
+        sites = spacecat_get(config, url, timeout=60)
         print_success(f"Found {len(sites)} sites")
         return sites
     except Exception as e:
@@ -205,70 +390,183 @@ def fetch_all_sites(config: dict) -> list:
         return []
 
 
-def find_site_by_name(sites: list, name_filter: str) -> list:
+def _is_unsupported_endpoint(error: Exception) -> bool:
+    """True for HTTP errors meaning the endpoint does not exist on this Spacecat deployment"""
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code in (400, 404, 405, 501)
+
+
+def fetch_sites_by_name(config: dict, name_filter: str) -> list:
+    """
+    Ask Spacecat to pre-filter sites by name, falling back to the full site
+    list when the search endpoint is not available or its result contains no
+    site that find_site_by_name() matches (the server may match on other fields).
+    """
+    url = f"{config['spacecat_api_base']}/sites?search={quote(name_filter)}"
+    
+    try:
+        print_info(f"Searching Spacecat sites for '{name_filter}'...")
+        sites = spacecat_get(config, url, timeout=60)
+        if sites and find_site_by_name(build_site_index(sites), name_filter):
+            print_success(f"Found {len(sites)} candidate sites")
+            return sites
+        print_info("Search returned no matching sites, checking the full site list...")
+    except Exception as e:
+        if not _is_unsupported_endpoint(e):
+            print_error(f"Failed to search sites: {e}")
+            return []
+    
+    return fetch_all_sites(config)
+
+
+def build_site_index(sites: list) -> dict:
+    """Lowercase every baseURL once and index sites by host for exact lookups"""
+    entries = [(site.get('baseURL', '').lower(), site) for site in sites]
+    by_host = {}
+    for base_url, site in entries:
+        by_host.setdefault(urlparse(base_url).netloc, []).append(site)
+    return {"entries": entries, "by_host": by_host}
+
+
+def find_site_by_name(site_index: dict, name_filter: str) -> list:
     name_filter = name_filter.lower()
-    matching = []
     
-    for site in sites:
-        base_url = site.get('baseURL', '').lower()
-        if name_filter in base_url:
-            matching.append(site)
+    # A fully-qualified host (or URL) resolves directly through the host index
+    host = urlparse(name_filter).netloc or name_filter
+    exact = site_index["by_host"].get(host) if host else None
+    if exact:
+        return list(exact)
     
-    return matching
+    return [site for base_url, site in site_index["entries"] if name_filter in base_url]
 
 
 def fetch_opportunities_for_site(config: dict, site_id: str) -> list:
     url = f"{config['spacecat_api_base']}/sites/{site_id}/opportunities"
-    headers = get_api_headers(config)
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return spacecat_get(config, url, timeout=30)
     except Exception as e:
         print_warning(f"Failed to fetch opportunities: {e}")
         return []
 
 
+def fetch_all_suggestions_for_site(config: dict, site_id: str):
+    """
+    Fetch every suggestion of a site in one request.
+
+    Returns None when the bulk endpoint is unavailable so callers can fall
+    back to one request per opportunity.
+    """
+    url = f"{config['spacecat_api_base']}/sites/{site_id}/opportunities/suggestions"
+    
+    try:
+        return spacecat_get(config, url, timeout=60)
+    except Exception as e:
+        if not _is_unsupported_endpoint(e):
+            print_warning(f"Failed to fetch site suggestions in bulk: {e}")
+        return None
+
+
 def fetch_suggestions_for_opportunity(config: dict, site_id: str, opportunity_id: str) -> list:
     url = f"{config['spacecat_api_base']}/sites/{site_id}/opportunities/{opportunity_id}/suggestions"
-    headers = get_api_headers(config)
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return spacecat_get(config, url, timeout=30)
     except Exception:
         return []
 
 
-def create_tar_archive_with_root_ownership(source_dir: str, output_path: str):
-    print_info(f"Creating tar.gz archive from {source_dir}...")
-    
-    with tarfile.open(output_path, "w:gz") as tar:
-        for root, dirs, files in os.walk(source_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, os.path.dirname(source_dir))
-                info = tar.gettarinfo(file_path, arcname=arcname)
-                info.uid = 0
-                info.gid = 0
-                info.uname = "root"
-                info.gname = "root"
-                with open(file_path, 'rb') as f:
-                    tar.addfile(info, f)
-            for d in dirs:
-                dir_path = os.path.join(root, d)
-                arcname = os.path.relpath(dir_path, os.path.dirname(source_dir))
-                info = tar.gettarinfo(dir_path, arcname=arcname)
-                info.uid = 0
-                info.gid = 0
-                info.uname = "root"
-                info.gname = "root"
-                tar.addfile(info)
-    
-    file_size = Path(output_path).stat().st_size / (1024 * 1024)
-    print_success(f"Created archive: {output_path} ({file_size:.2f} MB)")
+def build_exclude_pattern(patterns: list):
+    """Compile --exclude glob patterns into a single regex (None when there are none)"""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def _is_excluded(exclude, rel_path: str, name: str) -> bool:
+    return exclude is not None and bool(exclude.match(rel_path) or exclude.match(name))
+
+
+def _root_owned(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    info.uid = 0
+    info.gid = 0
+    info.uname = "root"
+    info.gname = "root"
+    return info
+
+
+def _open_for_archive(path: str):
+    """Open a file for reading without updating its access time where the OS allows it"""
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        # O_NOATIME is only permitted on files owned by the current user
+        fd = os.open(path, os.O_RDONLY)
+    return os.fdopen(fd, "rb")
+
+
+def _tarinfo_from_entry(entry: os.DirEntry, arcname: str):
+    """Build a root-owned TarInfo from a DirEntry's cached stat (None for unsupported types)"""
+    st = entry.stat(follow_symlinks=False)
+    info = tarfile.TarInfo(arcname)
+    info.mtime = st.st_mtime
+    info.mode = stat.S_IMODE(st.st_mode)
+    
+    if stat.S_ISLNK(st.st_mode):
+        info.type = tarfile.SYMTYPE
+        info.linkname = os.readlink(entry.path)
+    elif stat.S_ISREG(st.st_mode):
+        info.type = tarfile.REGTYPE
+        info.size = st.st_size
+    elif stat.S_ISDIR(st.st_mode):
+        info.type = tarfile.DIRTYPE
+    else:
+        return None
+    
+    return _root_owned(info)
+
+
+def _add_tree_to_tar(tar, source_dir: str, exclude=None):
+    # Archive paths are relative to the parent of source_dir
+    arc_root = os.path.relpath(source_dir, os.path.dirname(source_dir))
+    
+    def arcname(rel_path):
+        return rel_path if arc_root == "." else f"{arc_root}/{rel_path}"
+    
+    pending = [(source_dir, None, "")]
+    while pending:
+        dir_path, dir_entry, rel_dir = pending.pop()
+        has_members = False
+        
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in ARCHIVE_EXCLUDED_DIRS or _is_excluded(exclude, rel_path, entry.name):
+                        continue
+                    pending.append((entry.path, entry, rel_path))
+                    has_members = True
+                    continue
+                
+                if _is_excluded(exclude, rel_path, entry.name):
+                    continue
+                
+                info = _tarinfo_from_entry(entry, arcname(rel_path))
+                if info is None:
+                    continue
+                if info.isreg():
+                    with _open_for_archive(entry.path) as f:
+                        tar.addfile(info, f)
+                else:
+                    tar.addfile(info)
+                has_members = True
+        
+        # Parent directories are created implicitly on extraction; only empty
+        # directories need an explicit entry to survive the round trip.
+        if not has_members and dir_entry is not None:
+            tar.addfile(_tarinfo_from_entry(dir_entry, arcname(rel_dir)))
 
 
 def s3_object_exists(s3_client, bucket: str, s3_key: str) -> bool:
@@ -283,8 +581,156 @@ def s3_object_exists(s3_client, bucket: str, s3_key: str) -> bool:
         raise
 
 
-def upload_to_s3(s3_client, bucket: str, local_path: str, s3_key: str, force: bool = False) -> bool:
-    """Upload file to S3, with option to skip if already exists"""
+def _write_tar_stream(out, source_dir: str, mode: str, exclude, errors: list):
+    """Writer thread body: tar the tree into `out`, recording any failure in `errors`"""
+    try:
+        with tarfile.open(fileobj=out, mode=mode) as tar:
+            _add_tree_to_tar(tar, source_dir, exclude)
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        try:
+            out.close()
+        except OSError:
+            pass
+
+
+class ArchiveWriteError(Exception):
+    """The tar writer or pigz failed while the archive was being streamed"""
+
+
+class _CheckedArchiveReader:
+    """
+    Read end of the archive pipe that fails at EOF if the writer (or pigz)
+    failed, so upload_fileobj aborts instead of completing a truncated object.
+    """
+    
+    def __init__(self, raw, writer_thread, writer_errors: list, proc=None):
+        self.raw = raw
+        self.writer_thread = writer_thread
+        self.writer_errors = writer_errors
+        self.proc = proc
+    
+    def failure(self):
+        self.writer_thread.join()
+        if self.proc is not None:
+            self.proc.wait()
+        if self.writer_errors:
+            return self.writer_errors[0]
+        if self.proc is not None and self.proc.returncode != 0:
+            return f"pigz exited with code {self.proc.returncode}"
+        return None
+    
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        if not data and size != 0:
+            reason = self.failure()
+            if reason is not None:
+                raise ArchiveWriteError(f"Failed to create archive: {reason}")
+        return data
+
+
+def compute_repo_fingerprint(repo_path: str, exclude_patterns: list):
+    """
+    Identify the repository contents that would be archived.
+
+    Returns the git HEAD SHA for a clean checkout, HEAD plus a digest of the
+    working-tree changes (and --exclude patterns) otherwise, or None when
+    repo_path is not a git repository.
+    """
+    try:
+        head, toplevel, prefix = subprocess.run(
+            ["git", "-C", repo_path, "rev-parse", "HEAD", "--show-toplevel", "--show-prefix"],
+            capture_output=True, text=True, check=True
+        ).stdout.split("\n")[:3]
+        # Only changes inside the archived tree matter; porcelain paths stay relative to the toplevel
+        status = subprocess.run(
+            ["git", "-C", repo_path, "status", "--porcelain", "-z", "--untracked-files=all", "--", "."],
+            capture_output=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+    
+    if not status and not exclude_patterns and not prefix:
+        return head
+    
+    digest = hashlib.blake2b(digest_size=8)
+    # Different subdirectories of one checkout are different archives
+    digest.update(prefix.encode() + b"\0")
+    digest.update(status)
+    for pattern in exclude_patterns:
+        digest.update(pattern.encode() + b"\0")
+    
+    entries = iter(status.split(b"\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        if entry[:1] in (b"R", b"C"):
+            next(entries, None)  # renames/copies are followed by the original path
+        changed_path = Path(toplevel) / os.fsdecode(entry[3:])
+        if changed_path.is_file():
+            with open(changed_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+    
+    return f"{head}-{digest.hexdigest()}"
+
+
+def _strip_url_credentials(url: str) -> str:
+    parsed = urlparse(url)
+    if not parsed.username and not parsed.password:
+        return url
+    host = parsed.hostname or ""
+    if parsed.port:
+        host = f"{host}:{parsed.port}"
+    return urlunparse(parsed._replace(netloc=host))
+
+
+def build_code_manifest(repo_path: str, suggestions: list):
+    """
+    Describe the code an issue set touches without shipping the repository:
+    the git remote (credentials stripped), the HEAD SHA and the files that
+    contain any of the issues' faulty lines. Returns None for non-git paths.
+    """
+    def git(*git_args):
+        return subprocess.run(["git", "-C", repo_path, *git_args], capture_output=True, text=True)
+    
+    head = git("rev-parse", "HEAD")
+    if head.returncode != 0:
+        return None
+    remote = git("remote", "get-url", "origin")
+    
+    # The first non-blank line of each faulty snippet is specific enough to
+    # locate the file; every needle is searched in a single git grep pass.
+    needles = []
+    for s in suggestions:
+        first_line = next((line.strip() for line in (s['faultyLine'] or "").splitlines() if line.strip()), "")
+        if first_line and first_line not in needles:
+            needles.append(first_line)
+    
+    paths = []
+    if needles:
+        grep_args = ["grep", "-l", "-I", "-F"]
+        for needle in needles:
+            grep_args += ["-e", needle]
+        paths = sorted(git(*grep_args).stdout.splitlines())
+    
+    return {
+        "repo": _strip_url_credentials(remote.stdout.strip()) if remote.returncode == 0 else "",
+        "sha": head.stdout.strip(),
+        "paths": paths,
+    }
+
+
+def stream_archive_to_s3(s3_client, bucket: str, source_dir: str, s3_key: str,
+                         exclude=None, force: bool = False) -> bool:
+    """
+    Archive source_dir as tar.gz and upload it to S3 without a temporary file.
+
+    A writer thread produces the archive into a pipe (through pigz when it is
+    available) while the main thread feeds the other end to a multipart
+    upload, so parts start uploading as soon as the first chunk is compressed.
+    """
     
     # Check if object already exists (unless force upload is requested)
     if not force:
@@ -297,23 +743,78 @@ def upload_to_s3(s3_client, bucket: str, local_path: str, s3_key: str, force: bo
             print_warning(f"Could not check if object exists: {e}")
             print_info("Proceeding with upload...")
     
-    print_info(f"Uploading to s3://{bucket}/{s3_key}...")
+    from boto3.exceptions import S3UploadFailedError
+    from boto3.s3.transfer import TransferConfig
+    
+    print_info(f"Streaming tar.gz archive of {source_dir} to s3://{bucket}/{s3_key}...")
+    
+    pigz = shutil.which("pigz")
+    proc = None
+    if pigz:
+        # pigz compresses the uncompressed tar stream on all cores
+        proc = subprocess.Popen([pigz, "-c", "-6"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        reader, writer, mode = proc.stdout, proc.stdin, "w|"
+    else:
+        print_info("pigz not found, compressing with single-threaded gzip")
+        read_fd, write_fd = os.pipe()
+        reader, writer, mode = os.fdopen(read_fd, "rb"), os.fdopen(write_fd, "wb"), "w|gz"
+    
+    writer_errors = []
+    writer_thread = threading.Thread(
+        target=_write_tar_stream,
+        args=(writer, source_dir, mode, exclude, writer_errors),
+        daemon=True,
+    )
+    writer_thread.start()
+    
+    transfer_config = TransferConfig(
+        multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+        multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+        max_concurrency=S3_MAX_CONCURRENCY,
+        use_threads=True,
+    )
+    uploaded_chunks = []
+    checked_reader = _CheckedArchiveReader(reader, writer_thread, writer_errors, proc)
     
     try:
-        with open(local_path, "rb") as f:
-            s3_client.put_object(Bucket=bucket, Key=s3_key, Body=f)
-        print_success("Upload complete!")
-        return True
-    except ClientError as e:
+        s3_client.upload_fileobj(checked_reader, bucket, s3_key, Config=transfer_config,
+                                 Callback=uploaded_chunks.append)
+    except (ClientError, S3UploadFailedError) as e:
         print_error(f"Upload failed: {e}")
         return False
+    except ArchiveWriteError as e:
+        # Raised at EOF when the archive is incomplete: the upload is aborted, nothing is stored
+        print_error(str(e))
+        return False
+    finally:
+        # Closing the read end unblocks the writer if the upload stopped early
+        reader.close()
+        writer_thread.join()
+        if proc is not None:
+            proc.wait()
+    
+    reason = checked_reader.failure()
+    if reason is not None:
+        # The key is derived from the repository contents, so a truncated object
+        # left behind would be reused by every later run
+        print_error(f"Failed to create archive: {reason}")
+        try:
+            s3_client.delete_object(Bucket=bucket, Key=s3_key)
+        except ClientError as e:
+            print_error(f"Could not remove incomplete archive s3://{bucket}/{s3_key}: {e}")
+            print_error("Later runs would reuse it: run again with --force-reupload to replace it")
+        return False
+    
+    size_mb = sum(uploaded_chunks) / (1024 * 1024)
+    print_success(f"Upload complete! ({size_mb:.2f} MB)")
+    return True
 
 
 def send_sqs_message(sqs_client, queue_url: str, message: dict) -> str:
     try:
         response = sqs_client.send_message(
             QueueUrl=queue_url,
-            MessageBody=json.dumps(message)
+            MessageBody=json_dumps(message)
         )
         return response['MessageId']
     except ClientError as e:
@@ -321,38 +822,114 @@ def send_sqs_message(sqs_client, queue_url: str, message: dict) -> str:
         return None
 
 
+def _sqs_batches(bodies: list):
+    """Group encoded bodies into batches within both the entry-count and payload-size limits"""
+    batch, batch_bytes = [], 0
+    for body in bodies:
+        size = len(body.encode())
+        if batch and (len(batch) == SQS_MAX_BATCH_SIZE or batch_bytes + size > SQS_MAX_BATCH_BYTES):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(body)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def _is_transient_sqs_error(error: ClientError) -> bool:
+    response = error.response
+    return (response.get("Error", {}).get("Code") in SQS_THROTTLING_ERRORS
+            or response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500)
+
+
+def send_sqs_batch(sqs_client, queue_url: str, messages: list) -> list:
+    """
+    Send messages with send_message_batch, split by SQS_MAX_BATCH_SIZE entries
+    and SQS_MAX_BATCH_BYTES of payload.
+
+    Entries that fail on the service side, and throttling or 5xx errors, are
+    retried with exponential backoff; sender faults and other client errors
+    (oversized batch, access denied, missing queue) are reported and not
+    retried. Returns the message IDs of every message that was accepted.
+    """
+    message_ids = []
+    
+    for chunk in _sqs_batches([json_dumps(message) for message in messages]):
+        pending = {str(i): body for i, body in enumerate(chunk)}
+        
+        for attempt in range(SQS_BATCH_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(SQS_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            
+            entries = [{"Id": entry_id, "MessageBody": body} for entry_id, body in pending.items()]
+            try:
+                response = sqs_client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+            except ClientError as e:
+                if not _is_transient_sqs_error(e):
+                    print_error(f"SQS batch send failed: {e}")
+                    break
+                print_warning(f"SQS batch send failed (attempt {attempt + 1}/{SQS_BATCH_MAX_ATTEMPTS}): {e}")
+                continue
+            
+            for success in response.get("Successful", []):
+                message_ids.append(success["MessageId"])
+                pending.pop(success["Id"], None)
+            
+            for failure in response.get("Failed", []):
+                if failure.get("SenderFault"):
+                    print_error(f"SQS rejected message: {failure.get('Code')} - {failure.get('Message')}")
+                    pending.pop(failure["Id"], None)
+            
+            if not pending:
+                break
+        
+        if pending:
+            print_error(f"Failed to send {len(pending)} messages")
+    
+    return message_ids
+
+
 # ============================================================================
 # SUGGESTION ANALYSIS
 # ============================================================================
 
-def analyze_suggestions(suggestions: list) -> list:
+def analyze_suggestions(suggestions: list) -> tuple:
+    """
+    Return (valid_suggestions, by_aggregation_key) for suggestions that carry
+    an aggregation key; both are built in the same pass.
+    """
     valid_suggestions = []
+    by_agg_key = {}
     
     for suggestion in suggestions:
         data = suggestion.get('data', {})
         agg_key = data.get('aggregationKey')
         
         if agg_key:
-            valid_suggestions.append({
+            entry = {
                 'id': suggestion['id'],
                 'aggregationKey': agg_key,
                 'type': suggestion.get('type'),
                 'status': suggestion.get('status'),
                 'url': data.get('url', ''),
                 'issueType': extract_issue_type(agg_key),
-                'faultyLine': data.get('faultyLine', data.get('faulty_line', '')),
-                'targetSelector': data.get('targetSelector', data.get('target_selector', '')),
-                'issueDescription': data.get('issueDescription', data.get('issue_description', '')),
-            })
+                'faultyLine': data.get('faultyLine') or data.get('faulty_line', ''),
+                'targetSelector': data.get('targetSelector') or data.get('target_selector', ''),
+                'issueDescription': data.get('issueDescription') or data.get('issue_description', ''),
+            }
+            valid_suggestions.append(entry)
+            by_agg_key.setdefault(agg_key, []).append(entry)
     
-    return valid_suggestions
+    return valid_suggestions, by_agg_key
 
 
 def extract_issue_type(agg_key: str) -> str:
-    parts = agg_key.split('|')
-    if len(parts) >= 2:
-        return parts[1]
-    return "unknown"
+    # The issue type is the second '|'-separated field; partition avoids
+    # splitting the whole key into a list
+    _, sep, rest = agg_key.partition('|')
+    if not sep:
+        return "unknown"
+    return rest.partition('|')[0]
 
 
 def display_suggestions(suggestions: list, max_display: int = 10) -> list:
@@ -376,14 +953,97 @@ def display_suggestions(suggestions: list, max_display: int = 10) -> list:
     return displayed
 
 
+def build_issue(suggestion: dict) -> dict:
+    return {
+        "issue_name": suggestion['issueType'],
+        "issue_description": suggestion['issueDescription'] or f"Accessibility issue: {suggestion['issueType']}",
+        "faulty_line": suggestion['faultyLine'] or "",
+        "target_selector": suggestion['targetSelector'] or "",
+        "suggestion_id": suggestion['id'],
+    }
+
+
+def build_message(site_id: str, selected: dict, issues_list: list, code_bucket: str, code_path: str,
+                  audit_id: str, sent_at: str, code_manifest: dict = None) -> dict:
+    message = {
+        "type": "guidance:accessibility-remediation",
+        "siteId": site_id,
+        "auditId": audit_id,
+        "time": sent_at,
+        "data": {
+            "url": selected['url'],
+            "opportunityId": selected['opportunityId'],
+            "aggregationKey": selected['aggregationKey'],
+            "issuesList": issues_list,
+            "codeBucket": code_bucket,
+            "codePath": code_path,
+        }
+    }
+    if code_manifest:
+        message["data"]["codeManifest"] = code_manifest
+    return message
+
+
+def _analyze_opportunity_suggestions(opportunity: dict, suggestions: list) -> tuple:
+    valid, by_agg_key = analyze_suggestions(suggestions) if suggestions else ([], {})
+    for s in valid:
+        s['opportunityId'] = opportunity['id']
+        s['opportunityType'] = opportunity.get('type', '')
+    return valid, by_agg_key
+
+
+def collect_suggestions(config: dict, site_id: str, opportunities: list) -> tuple:
+    """
+    Fetch and analyze the suggestions of the given opportunities.
+
+    Returns (all_suggestions, by_aggregation_key), both in opportunity order.
+    """
+    bulk = fetch_all_suggestions_for_site(config, site_id)
+    if bulk is not None:
+        # One request for the whole site; group the flat list by opportunity
+        by_opportunity = {}
+        for suggestion in bulk:
+            by_opportunity.setdefault(suggestion.get('opportunityId'), []).append(suggestion)
+        analyzed = [
+            _analyze_opportunity_suggestions(opp, by_opportunity.get(opp['id']))
+            for opp in opportunities
+        ]
+    else:
+        # Analyze each opportunity as soon as its response arrives, while the
+        # remaining requests are still in flight; results keep opportunity order.
+        analyzed = [([], {}) for _ in opportunities]
+        with ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+            futures = {
+                executor.submit(fetch_suggestions_for_opportunity, config, site_id, opp['id']): i
+                for i, opp in enumerate(opportunities)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                analyzed[i] = _analyze_opportunity_suggestions(opportunities[i], future.result())
+    
+    all_suggestions = []
+    by_agg_key = {}
+    for valid, groups in analyzed:
+        all_suggestions.extend(valid)
+        for agg_key, entries in groups.items():
+            by_agg_key.setdefault(agg_key, []).extend(entries)
+    
+    return all_suggestions, by_agg_key
+
+
 def run_workflow(args):
     print_section("Loading Configuration")
     load_env_file()
     config = get_config()
+    config['use_cache'] = not args.no_cache
     
     if not validate_config(config):
         sys.exit(1)
     
+    if args.refresh_cache:
+        removed = clear_response_cache()
+        print_info(f"Cleared {removed} cached Spacecat responses")
+    
     credentials = get_aws_credentials()
     if not credentials.get("aws_access_key_id"):
         print_error("AWS credentials not found. Please check your .env file.")
@@ -401,12 +1061,12 @@ def run_workflow(args):
     site_url = None
     
     if not site_id:
-        sites = fetch_all_sites(config)
+        sites = fetch_sites_by_name(config, args.name)
         if not sites:
             print_error("No sites found")
             sys.exit(1)
         
-        matching = find_site_by_name(sites, args.name)
+        matching = find_site_by_name(build_site_index(sites), args.name)
         
         if not matching:
             print_error(f"No sites found matching '{args.name}'")
@@ -439,6 +1099,7 @@ def run_workflow(args):
     opportunity_id = args.opportunity_id
     suggestion_id = args.suggestion_id
     all_suggestions = []
+    suggestions_by_agg_key = {}
     
     if opportunity_id and suggestion_id:
         print_section("Step 2-4: Using Provided IDs")
@@ -450,7 +1111,7 @@ def run_workflow(args):
             print_error(f"No suggestions found for opportunity {opportunity_id}")
             sys.exit(1)
         
-        valid = analyze_suggestions(suggestions)
+        valid, suggestions_by_agg_key = analyze_suggestions(suggestions)
         for s in valid:
             s['opportunityId'] = opportunity_id
             s['opportunityType'] = 'accessibility'
@@ -485,7 +1146,7 @@ def run_workflow(args):
         # Filter for preapproved opportunity types
         a11y_opportunities = [
             o for o in opportunities 
-            if o.get('type') in PREAPPROVED_OPPORTUNITY_TYPES
+            if o.get('type') in _PREAPPROVED_TYPE_SET
         ]
         
         if not a11y_opportunities:
@@ -498,16 +1159,7 @@ def run_workflow(args):
         # Step 3: Find suggestions
         print_section("Step 3: Finding Suggestions")
         
-        for opp in a11y_opportunities:
-            opp_id = opp['id']
-            suggestions = fetch_suggestions_for_opportunity(config, site_id, opp_id)
-            
-            if suggestions:
-                valid = analyze_suggestions(suggestions)
-                for s in valid:
-                    s['opportunityId'] = opp_id
-                    s['opportunityType'] = opp.get('type', '')
-                all_suggestions.extend(valid)
+        all_suggestions, suggestions_by_agg_key = collect_suggestions(config, site_id, a11y_opportunities)
         
         if not all_suggestions:
             print_error("No valid suggestions found with aggregation keys")
@@ -540,75 +1192,74 @@ def run_workflow(args):
         print_error(f"Repo path does not exist: {repo_path}")
         sys.exit(1)
     
-    # Use custom S3 key if provided, otherwise generate one with timestamp
+    # Use custom S3 key if provided, otherwise key the archive by repository
+    # contents so an unchanged repo reuses the previous upload
+    repo_name = Path(repo_path).name
     if args.s3_key:
         s3_key = args.s3_key
         print_info(f"Using custom S3 key: {s3_key}")
     else:
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-        repo_name = Path(repo_path).name
-        s3_key = f"tmp/codefix/source/{repo_name}-{timestamp}.tar.gz"
+        fingerprint = compute_repo_fingerprint(repo_path, args.exclude)
+        if fingerprint:
+            print_info(f"Repository fingerprint: {fingerprint}")
+        else:
+            print_warning("Repo path is not a git repository, using a timestamped S3 key")
+            fingerprint = datetime.now().strftime('%Y%m%d-%H%M%S')
+        s3_key = f"tmp/codefix/source/{repo_name}-{fingerprint}.tar.gz"
     
-    s3_client = boto3.client("s3", **credentials)
-    sqs_client = boto3.client("sqs", **credentials)
+    s3_client, sqs_client = create_aws_clients(credentials)
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tar_path = Path(tmp_dir) / f"{repo_name}.tar.gz"
-        create_tar_archive_with_root_ownership(repo_path, str(tar_path))
-        
-        if not upload_to_s3(s3_client, config['s3_bucket'], str(tar_path), s3_key, force=args.force_reupload):
-            sys.exit(1)
+    if not stream_archive_to_s3(s3_client, config['s3_bucket'], repo_path, s3_key,
+                                exclude=build_exclude_pattern(args.exclude),
+                                force=args.force_reupload):
+        sys.exit(1)
     
     # Step 6: Create SQS message
     print_section("Step 6: Creating SQS Message")
     
-    issues_list = []
     if args.send_all_issues:
-        matching_suggestions = [s for s in all_suggestions 
-                               if s['aggregationKey'] == selected['aggregationKey']]
+        matching_suggestions = suggestions_by_agg_key[selected['aggregationKey']]
         print_info(f"Sending all {len(matching_suggestions)} issues with aggregation key: {selected['aggregationKey']}")
-        
-        for s in matching_suggestions:
-            issues_list.append({
-                "issue_name": s['issueType'],
-                "issue_description": s['issueDescription'] or f"Accessibility issue: {s['issueType']}",
-                "faulty_line": s['faultyLine'] or "",
-                "target_selector": s['targetSelector'] or "",
-                "suggestion_id": s['id'],
-            })
     else:
         print_info("Sending single issue (use --send-all-issues to send all related issues)")
-        issues_list.append({
-            "issue_name": selected['issueType'],
-            "issue_description": selected['issueDescription'] or f"Accessibility issue: {selected['issueType']}",
-            "faulty_line": selected['faultyLine'] or "",
-            "target_selector": selected['targetSelector'] or "",
-            "suggestion_id": selected['id'],
-        })
+        matching_suggestions = [selected]
     
-    message = {
-        "type": "guidance:accessibility-remediation",
-        "siteId": site_id,
-        "auditId": str(uuid.uuid4()),
-        "time": datetime.now(UTC).isoformat(),
-        "data": {
-            "url": selected['url'],
-            "opportunityId": selected['opportunityId'],
-            "aggregationKey": selected['aggregationKey'],
-            "issuesList": issues_list,
-            "codeBucket": config['s3_bucket'],
-            "codePath": s3_key,
-        }
-    }
+    code_manifest = None
+    if args.code_manifest:
+        code_manifest = build_code_manifest(repo_path, matching_suggestions)
+        if code_manifest:
+            print_info(f"Code manifest: {len(code_manifest['paths'])} files at {code_manifest['sha']}")
+        else:
+            print_warning("Repo path is not a git repository, sending message without a code manifest")
+    
+    # One audit ID and timestamp for everything sent in this run
+    audit_id = uuid7()
+    sent_at = datetime.now(UTC).isoformat()
     
-    print_info("Message to be sent:")
+    if args.message_per_issue:
+        messages = [
+            build_message(site_id, s, [build_issue(s)], config['s3_bucket'], s3_key,
+                          audit_id, sent_at, code_manifest)
+            for s in matching_suggestions
+        ]
+        print_info(f"One message per issue: {len(messages)} messages, sent in batches of {SQS_MAX_BATCH_SIZE}")
+    else:
+        issues_list = [build_issue(s) for s in matching_suggestions]
+        messages = [build_message(site_id, selected, issues_list, config['s3_bucket'], s3_key,
+                                  audit_id, sent_at, code_manifest)]
+    
+    if len(messages) == 1:
+        print_info("Message to be sent:")
+    else:
+        print_info(f"First of {len(messages)} messages to be sent:")
     print()
-    print(json.dumps(message, indent=2))
+    print(json.dumps(messages[0], indent=2))
     print()
     
     # Step 7: Confirmation
+    prompt = "Send this message? (Y/N): " if len(messages) == 1 else f"Send these {len(messages)} messages? (Y/N): "
     try:
-        confirm = input("Send this message? (Y/N): ").strip().upper()
+        confirm = input(prompt).strip().upper()
         if confirm != 'Y':
             print_warning("Cancelled by user")
             sys.exit(0)
@@ -619,11 +1270,16 @@ def run_workflow(args):
     # Step 8: Send message
     print_section("Step 7: Sending Message")
     
-    message_id = send_sqs_message(sqs_client, config['sqs_queue_url'], message)
+    if args.message_per_issue:
+        message_ids = send_sqs_batch(sqs_client, config['sqs_queue_url'], messages)
+    else:
+        message_id = send_sqs_message(sqs_client, config['sqs_queue_url'], messages[0])
+        message_ids = [message_id] if message_id else []
     
-    if message_id:
-        print_success(f"Message sent successfully!")
-        print_info(f"Message ID: {message_id}")
+    if len(message_ids) == len(messages):
+        print_success("Message sent successfully!" if len(messages) == 1 else f"All {len(messages)} messages sent successfully!")
+        for message_id in message_ids:
+            print_info(f"Message ID: {message_id}")
         print_info(f"Site ID: {site_id}")
         print_info(f"Opportunity ID: {selected['opportunityId']}")
         print_info(f"Suggestion ID: {selected['id']}")
@@ -634,6 +1290,9 @@ def run_workflow(args):
         print(f"   index=dx_aem_engineering sourcetype=dx_aem_sites_mystique_backend_dev \"{selected['opportunityId']}\"")
         print_info("2. Check for generated diff in S3")
         print_info("3. Verify results in Spacecat opportunity")
+    elif message_ids:
+        print_error(f"Only {len(message_ids)} of {len(messages)} messages were sent")
+        sys.exit(1)
     else:
         print_error("Failed to send message")
         sys.exit(1)
@@ -657,12 +1316,21 @@ Examples:
   # Send all related issues instead of just one
   python a11y-autofix.py --name sunstargum --send-all-issues
 
+  # Send all related issues as one SQS message each (batched)
+  python a11y-autofix.py --name sunstargum --send-all-issues --message-per-issue
+
   # Force reupload even if archive exists in S3
   python a11y-autofix.py --name sunstargum --force-reupload
 
   # Reuse an existing S3 archive
   python a11y-autofix.py --name sunstargum --s3-key tmp/codefix/source/my-repo.tar.gz
 
+  # Leave test modules and zip files out of the code archive
+  python a11y-autofix.py --name sunstargum --exclude 'ui.tests' --exclude '*.zip'
+
+  # Ignore cached Spacecat responses (cached for 5 minutes by default)
+  python a11y-autofix.py --name sunstargum --refresh-cache
+
 Configuration:
   All configuration is loaded from .env file in the script directory.
   See runbook.md for detailed setup instructions.
@@ -692,6 +1360,16 @@ Configuration:
         action="store_true",
         help="Send all issues for the selected suggestion/aggregation key (default: only first issue)"
     )
+    parser.add_argument(
+        "--message-per-issue",
+        action="store_true",
+        help="With --send-all-issues, send one SQS message per issue (batched) instead of one combined message"
+    )
+    parser.add_argument(
+        "--code-manifest",
+        action="store_true",
+        help="Also include a manifest (git remote, HEAD SHA, files containing the faulty lines) in the message"
+    )
     parser.add_argument(
         "--force-reupload",
         action="store_true",
@@ -699,11 +1377,31 @@ Configuration:
     )
     parser.add_argument(
         "--s3-key",
-        help="Custom S3 key path for the archive (default: auto-generated with timestamp)"
+        help="Custom S3 key path for the archive (default: derived from the repo's git HEAD and local changes)"
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Glob pattern (relative path or name) to leave out of the code archive; may be repeated"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk Spacecat response cache for this run"
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Clear the on-disk Spacecat response cache before running"
     )
     
     args = parser.parse_args()
     
+    if args.message_per_issue and not args.send_all_issues:
+        parser.error("--message-per-issue requires --send-all-issues")
+    
     print_section("A11y Autofix Requestor")
     run_workflow(args)
 
@@ -23,14 +23,22 @@ Usage:
 """
 
 import argparse
+import hashlib
 
 DEBUG = False
 import json
 import os
 import re
+import shlex
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 try:
     from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
@@ -41,6 +49,8 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: requests library not found. Install with: pip install requests")
     sys.exit(1)
@@ -52,6 +62,53 @@ except ImportError:
     DOTENV_AVAILABLE = False
     print("WARNING: python-dotenv not found. Install with: pip install python-dotenv")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Captured SSO headers are cached per program so later runs can skip the browser
+HEADER_CACHE_DIR = Path.home() / ".cache" / "customer_repo_clone"
+HEADER_CACHE_TTL = 3600
+VOLATILE_HEADERS = {"content-length", "host"}
+
+BROWSER_PROFILE_DIR = Path.home() / ".cache" / "crc-chromium"
+BROWSER_DEBUG_PORT = 9222
+BROWSER_CDP_ENDPOINT = f"http://localhost:{BROWSER_DEBUG_PORT}"
+HEADLESS_CAPTURE_TIMEOUT_MS = 15000
+
+# Staging/dev hosts the SSO flow sometimes bounces through, mapped to production
+_STG_MAP = {
+    "auth-stg.services.adobe.com": "auth.services.adobe.com",
+    "auth-stg1.services.adobe.com": "auth.services.adobe.com",
+    "auth-stg2.services.adobe.com": "auth.services.adobe.com",
+    "-stg.": ".",
+    "-stg1.": ".",
+    "-stg2.": ".",
+    "ssg-dev.adobe.io": "ssg.adobe.io",
+}
+_STG_RE = re.compile(r"auth-stg[12]?\.services\.adobe\.com|-stg[12]?\.|ssg-dev\.adobe\.io")
+_HOST_STG_RE = re.compile(r"auth-stg[12]?\.services\.adobe\.com|ssg-dev\.adobe\.io")
+# Frame navigations: the same host rewrites plus a HAL hash that lost the repositories path
+_FRAME_REWRITE_RE = re.compile(
+    r"auth-stg[12]?\.services\.adobe\.com|ssg-dev\.adobe\.io|#https://ssg\.adobe\.io/api(?!.*repositories)"
+)
+# Subresources that never carry the SSO/API URLs, so they skip the rewrite entirely
+_PASSTHROUGH_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media", "other"})
+# Of those, the ones not worth downloading at all, except on the SSO login pages
+# where the sign-in form needs them to render
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+_SSO_ASSET_HOST_RE = re.compile(r"^https?://[^/]*(?:auth[^/.]*\.services\.adobe\.com|adobelogin\.com|imsdirect|okta\.com)")
+
+# The only repository fields the filter and clone steps read
+REPOSITORY_FIELDS = ("id", "repo", "status", "repositoryUrl")
+
+# Repository selection: names containing any of these keywords are never picked
+_EXCLUDE_RE = re.compile(r"config|dispatcher|qa|stage|dev", re.IGNORECASE)
+_FALLBACK_PATTERN = re.compile(r'^[^-]+-aem-cloud$')
+
 
 def print_section(title: str):
     print(f"\n{'=' * 80}")
@@ -75,6 +132,15 @@ def print_warning(message: str):
     print(f"⚠ {message}")
 
 
+# One .env assignment per line: optional `export`, then a double-quoted,
+# single-quoted or bare value; a bare value ends at a ` #` comment.
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:"([^"\r\n]*)"|\'([^\'\r\n]*)\'|([^\r\n]*?))[ \t]*(?:[ \t]#[^\r\n]*)?$',
+    re.MULTILINE,
+)
+
+
 def load_env_file(env_path: str = ".env") -> bool:
     env_file = Path(env_path)
     
@@ -94,17 +160,10 @@ def load_env_file(env_path: str = ".env") -> bool:
             print_warning(f"Failed to load with python-dotenv: {e}")
 
     try:
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if line.startswith('export '):
-                    line = line[7:]
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    value = value.strip('"').strip("'")
-                    os.environ[key] = value
+        for match in _ENV_LINE_RE.finditer(env_file.read_text()):
+            key, double_quoted, single_quoted, bare = match.groups()
+            os.environ[key] = double_quoted if double_quoted is not None else (
+                single_quoted if single_quoted is not None else bare)
         print_success(f"Loaded configuration from {env_file} (manual parsing)")
         return True
     except Exception as e:
@@ -116,6 +175,7 @@ def get_config():
     return {
         "central_repo_dir": os.getenv("CENTRAL_REPO_DIR", ""),
         "program_id": os.getenv("PROGRAM_ID", ""),
+        "clone_timeout": os.getenv("CLONE_TIMEOUT", "1800"),
     }
 
 
@@ -135,14 +195,82 @@ def validate_config(config: dict) -> bool:
             print_error(f"Failed to create directory: {e}")
             return False
     
+    try:
+        config["clone_timeout"] = int(config["clone_timeout"])
+        if config["clone_timeout"] <= 0:
+            raise ValueError
+    except ValueError:
+        print_error(f"CLONE_TIMEOUT must be a positive number of seconds, got: {config['clone_timeout']!r}")
+        return False
+    
     return True
 
 
-def capture_auth_headers(program_id: str) -> dict:
-    print_section("Step 1: Browser Authentication")
-    print_info("Opening browser for SSO authentication...")
-    print_info("Please complete the authentication process in the browser window.")
+def _ensure_chromium(p):
+    """Install Playwright's Chromium on first use instead of failing the launch"""
+    if os.getenv("SKIP_PLAYWRIGHT_AUTOINSTALL") == "1" or os.path.exists(p.chromium.executable_path):
+        return
+    
+    print_info("Playwright Chromium not found, installing it (one-time)...")
+    try:
+        subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"], check=True)
+    except (subprocess.CalledProcessError, OSError) as e:
+        print_error(f"Failed to install Chromium: {e}")
+        print_info("Run manually: playwright install chromium")
+        sys.exit(1)
+
+
+def run_browser_daemon():
+    """Keep a Chromium with a persistent profile running for later invocations to attach to"""
+    print_section("Browser Daemon")
+    BROWSER_PROFILE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    
+    with sync_playwright() as p:
+        _ensure_chromium(p)
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=str(BROWSER_PROFILE_DIR),
+            headless=False,
+            args=[f"--remote-debugging-port={BROWSER_DEBUG_PORT}"],
+        )
+        print_success(f"Browser listening on {BROWSER_CDP_ENDPOINT} (profile: {BROWSER_PROFILE_DIR})")
+        print_info("Leave this running; other invocations will reuse it. Press Ctrl+C or close the browser to stop.")
+        
+        try:
+            context.wait_for_event("close", timeout=0)
+        except KeyboardInterrupt:
+            context.close()
+
+
+def _open_browser(p, headless: bool = False):
+    """
+    Attach to a running --daemon browser if there is one, otherwise launch
+    one on the persistent profile so the SSO session survives between runs.
+    """
+    try:
+        browser = p.chromium.connect_over_cdp(BROWSER_CDP_ENDPOINT, timeout=2000)
+    except Exception:
+        _ensure_chromium(p)
+        BROWSER_PROFILE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=str(BROWSER_PROFILE_DIR),
+            headless=headless,
+            ignore_https_errors=False,
+            java_script_enabled=True,
+        )
+        return context, False
     
+    print_info("Attached to running browser daemon")
+    # The default context carries the daemon profile's SSO cookies
+    context = browser.contexts[0] if browser.contexts else browser.new_context()
+    return context, True
+
+
+def _has_saved_session() -> bool:
+    profile = BROWSER_PROFILE_DIR / "Default"
+    return (profile / "Cookies").exists() or (profile / "Network" / "Cookies").exists()
+
+
+def _capture_with_browser(p, program_id: str, headless: bool, timeout_ms: int) -> dict:
     target_url = f"https://git.corp.adobe.com/pages/experience-platform/self-service-hal-browser/#https://ssg.adobe.io/api/program/{program_id}/repositories"
     api_url_pattern = f"https://ssg.adobe.io/api/program/{program_id}/repositories"
     
@@ -150,125 +278,136 @@ def capture_auth_headers(program_id: str) -> dict:
     request_count = 0
     ssg_requests = []
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            ignore_https_errors=False,
-            java_script_enabled=True,
-        )
-        page = context.new_page()
+    context, attached = _open_browser(p, headless=headless)
+    page = context.new_page() if attached or not context.pages else context.pages[0]
+    
+    def handle_route(route):
+        resource_type = route.request.resource_type
+        if resource_type in _PASSTHROUGH_RESOURCE_TYPES:
+            if resource_type in _BLOCKED_RESOURCE_TYPES and not _SSO_ASSET_HOST_RE.match(route.request.url):
+                route.abort()
+            else:
+                route.continue_()
+            return
         
-        def handle_route(route):
-            url = route.request.url
-            modified = False
-            new_url = url
-            
-            if "auth-stg" in url or "stg1" in url or "stg2" in url:
-                new_url = new_url.replace("auth-stg1.services.adobe.com", "auth.services.adobe.com")
-                new_url = new_url.replace("auth-stg2.services.adobe.com", "auth.services.adobe.com")
-                new_url = new_url.replace("auth-stg.services.adobe.com", "auth.services.adobe.com")
-                new_url = new_url.replace("-stg1.", ".")
-                new_url = new_url.replace("-stg2.", ".")
-                new_url = new_url.replace("-stg.", ".")
-                modified = True
-            
-            if "ssg-dev.adobe.io" in url:
-                new_url = new_url.replace("ssg-dev.adobe.io", "ssg.adobe.io")
-                modified = True
-            
-            if DEBUG and modified and new_url != url:
-                print_warning(f"Redirecting to production: {url[:60]}")
-                print_info(f"  -> {new_url[:60]}")
-                
-            route.continue_(url=new_url)
+        url = route.request.url
+        # Generic -stg. hosts are only rewritten once the flow is on staging auth
+        on_staging = "auth-stg" in url or "stg1" in url or "stg2" in url
+        pattern = _STG_RE if on_staging else _HOST_STG_RE
+        new_url = pattern.sub(lambda m: _STG_MAP[m.group(0)], url)
         
-        page.route("**/*", handle_route)
+        if new_url == url:
+            route.continue_()
+            return
         
-        def handle_response(response):
-            if response.status in [301, 302, 303, 307, 308]:
-                location = response.headers.get('location', '')
-                if location and ('stg' in location or 'stg1' in location or 'stg2' in location):
-                    print_warning(f"Detected staging redirect in response: {location[:60]}")
+        if DEBUG:
+            print_warning(f"Redirecting to production: {url[:60]}")
+            print_info(f"  -> {new_url[:60]}")
         
-        page.on("response", handle_response)
+        route.continue_(url=new_url)
+    
+    page.route("**/*", handle_route)
+    
+    def handle_response(response):
+        if response.status in [301, 302, 303, 307, 308]:
+            location = response.headers.get('location', '')
+            if location and ('stg' in location or 'stg1' in location or 'stg2' in location):
+                print_warning(f"Detected staging redirect in response: {location[:60]}")
+    
+    page.on("response", handle_response)
+    
+    repositories_hash = f"#https://ssg.adobe.io/api/program/{program_id}/repositories"
+    
+    def rewrite_frame_token(match):
+        token = match.group(0)
+        if token.startswith("#"):
+            if DEBUG:
+                print_warning("Detected incorrect API path, correcting to repositories endpoint")
+            return repositories_hash
+        return _STG_MAP[token]
+    
+    def handle_framenavigated(frame):
+        current_url = frame.url
+        new_url = _FRAME_REWRITE_RE.sub(rewrite_frame_token, current_url)
         
-        def handle_framenavigated(frame):
-            current_url = frame.url
-            new_url = current_url
-            needs_redirect = False
-            
-            if "auth-stg" in current_url or "stg1" in current_url or "stg2" in current_url:
-                new_url = new_url.replace("auth-stg1.services.adobe.com", "auth.services.adobe.com")
-                new_url = new_url.replace("auth-stg2.services.adobe.com", "auth.services.adobe.com")
-                new_url = new_url.replace("auth-stg.services.adobe.com", "auth.services.adobe.com")
-                needs_redirect = True
-            
-            if "ssg-dev.adobe.io" in current_url:
-                new_url = new_url.replace("ssg-dev.adobe.io", "ssg.adobe.io")
-                needs_redirect = True
-            
-            if "#https://ssg.adobe.io/api" in current_url and "repositories" not in current_url:
-                new_url = new_url.replace("#https://ssg.adobe.io/api", f"#https://ssg.adobe.io/api/program/{program_id}/repositories")
-                needs_redirect = True
-                if DEBUG:
-                    print_warning("Detected incorrect API path, correcting to repositories endpoint")
-            
-            if needs_redirect and new_url != current_url:
+        if new_url != current_url:
+            if DEBUG:
+                print_warning(f"Frame navigated to wrong endpoint, redirecting...")
+                print_info(f"  From: {current_url[:80]}")
+                print_info(f"  To: {new_url[:80]}")
+            try:
+                page.goto(new_url, wait_until="domcontentloaded", timeout=60000)
+            except Exception as e:
                 if DEBUG:
-                    print_warning(f"Frame navigated to wrong endpoint, redirecting...")
-                    print_info(f"  From: {current_url[:80]}")
-                    print_info(f"  To: {new_url[:80]}")
-                try:
-                    page.goto(new_url, wait_until="domcontentloaded", timeout=60000)
-                except Exception as e:
-                    if DEBUG:
-                        print_warning(f"Failed to redirect: {e}")
-        
-        page.on("framenavigated", handle_framenavigated)
+                    print_warning(f"Failed to redirect: {e}")
+    
+    page.on("framenavigated", handle_framenavigated)
+    
+    def handle_request(request):
+        nonlocal request_count
+        request_count += 1
+        if "ssg.adobe.io" in request.url:
+            ssg_requests.append(request.url)
+            if DEBUG:
+                print_info(f"SSG API call: {request.url}")
+        if api_url_pattern in request.url:
+            captured_headers.update(dict(request.headers))
+            print_success(f"Captured authentication headers")
+    
+    page.on("request", handle_request)
+    
+    try:
+        print_info(f"Navigating to: {target_url}")
+        # One budget for navigation and the API call together
+        deadline = time.monotonic() + timeout_ms / 1000
+        page.goto(target_url, wait_until="domcontentloaded", timeout=timeout_ms)
         
-        def handle_request(request):
-            nonlocal request_count
-            request_count += 1
-            if "ssg.adobe.io" in request.url:
-                ssg_requests.append(request.url)
-                if DEBUG:
-                    print_info(f"SSG API call: {request.url}")
-            if api_url_pattern in request.url:
-                captured_headers.update(dict(request.headers))
-                print_success(f"Captured authentication headers")
+        if not captured_headers:
+            print_info("Waiting for authentication and page load...")
+            # Returns as soon as the HAL browser issues the repositories call
+            remaining_ms = max(1, int((deadline - time.monotonic()) * 1000))  # 0 would mean no timeout
+            request = page.wait_for_request(lambda r: api_url_pattern in r.url, timeout=remaining_ms)
+            captured_headers.update(dict(request.headers))
         
-        page.on("request", handle_request)
+        if DEBUG:
+            print_success("Headers captured! Closing browser...")
         
-        try:
-            print_info(f"Navigating to: {target_url}")
-            page.goto(target_url, wait_until="domcontentloaded", timeout=300000)
-            
-            print_info("Waiting for authentication and page load...")
-            page.wait_for_timeout(5000)
-            
-            
-            max_attempts = 60
-            for attempt in range(max_attempts):
-                if captured_headers:
-                    if DEBUG:
-                        print_success("Headers captured! Closing browser...")
-                    break
-                    
-                if DEBUG and attempt % 10 == 0:
-                    print_info(f"Waiting for API call... ({attempt+1}/{max_attempts} - {(max_attempts-attempt)*5}s remaining)")
-                    print_info(f"  Total requests: {request_count}, SSG API calls: {len(ssg_requests)}")
-                    
-                    if len(ssg_requests) > 0:
-                        print_info(f"  Last SSG API call: {ssg_requests[-1][:80]}...")
-                
-                page.wait_for_timeout(5000)
-            
-        except PlaywrightTimeoutError:
+    except PlaywrightTimeoutError:
+        if not headless:
             print_warning("Page load timed out, but may have captured headers")
-        except Exception as e:
-            print_error(f"Error during browser automation: {e}")
-        finally:
-            browser.close()
+        if DEBUG:
+            print_info(f"  Total requests: {request_count}, SSG API calls: {len(ssg_requests)}")
+            if ssg_requests:
+                print_info(f"  Last SSG API call: {ssg_requests[-1][:80]}...")
+    except Exception as e:
+        print_error(f"Error during browser automation: {e}")
+    finally:
+        if attached:
+            # Leave the daemon (and its session) running for the next invocation
+            page.close()
+        else:
+            context.close()
+    
+    return captured_headers
+
+
+def capture_auth_headers(program_id: str) -> dict:
+    print_section("Step 1: Browser Authentication")
+    
+    captured_headers = {}
+    
+    with sync_playwright() as p:
+        if _has_saved_session():
+            # Warm profile: the SSO cookies usually complete sign-in without any interaction
+            print_info("Found a saved browser session, signing in headless...")
+            captured_headers = _capture_with_browser(p, program_id, headless=True, timeout_ms=HEADLESS_CAPTURE_TIMEOUT_MS)
+            if not captured_headers:
+                print_warning("Headless sign-in did not complete, opening the browser window")
+        
+        if not captured_headers:
+            print_info("Opening browser for SSO authentication...")
+            print_info("Please complete the authentication process in the browser window.")
+            captured_headers = _capture_with_browser(p, program_id, headless=False, timeout_ms=300000)
     
     if not captured_headers:
         print_error("Failed to capture authentication headers")
@@ -279,55 +418,257 @@ def capture_auth_headers(program_id: str) -> dict:
     return captured_headers
 
 
-def fetch_repositories(program_id: str, headers: dict) -> list:
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def create_http_session() -> requests.Session:
+    """Shared SSG session: keeps the TLS connection alive across all API calls"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+
+def prewarm_connection(session: requests.Session) -> threading.Thread:
+    """Open the SSG TLS connection in the background while the browser handles SSO"""
+    def warm():
+        try:
+            session.head("https://ssg.adobe.io/", timeout=10)
+        except requests.exceptions.RequestException:
+            pass
+    
+    thread = threading.Thread(target=warm, daemon=True)
+    thread.start()
+    return thread
+
+
+def _header_cache_file(program_id: str, headers: dict) -> Path:
+    """One cache file per program and credential, so users sharing a machine don't clobber each other"""
+    authorization = next((value for name, value in headers.items() if name.lower() == "authorization"), "")
+    digest = hashlib.sha256(authorization.encode()).hexdigest()[:16]
+    return HEADER_CACHE_DIR / f"{program_id}-{digest}.json"
+
+
+def _load_cached_headers(program_id: str) -> list:
+    """Unexpired cached header sets for the program, newest first; expired files are removed"""
+    entries = []
+    now = time.time()
+    for cache_file in HEADER_CACHE_DIR.glob(f"{program_id}-*.json"):
+        try:
+            with open(cache_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            continue
+        
+        if cached.get("expires", 0) < now:
+            cache_file.unlink(missing_ok=True)
+            continue
+        
+        if cached.get("headers"):
+            entries.append(cached)
+    
+    entries.sort(key=lambda cached: cached["expires"], reverse=True)
+    return [cached["headers"] for cached in entries]
+
+
+def _save_cached_headers(program_id: str, headers: dict, ttl: int = HEADER_CACHE_TTL):
+    strip_cookies = os.getenv("HEADER_CACHE_STRIP_COOKIES", "").lower() in ("1", "true", "yes")
+    cacheable = {
+        name: value for name, value in headers.items()
+        if name.lower() not in VOLATILE_HEADERS
+        and not name.startswith(":")
+        and not (strip_cookies and name.lower() == "cookie")
+    }
+    
+    try:
+        HEADER_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The headers carry credentials: keep the file readable by the owner only
+        fd = os.open(_header_cache_file(program_id, cacheable), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"expires": time.time() + ttl, "headers": cacheable}, f)
+    except OSError as e:
+        print_warning(f"Could not cache authentication headers: {e}")
+
+
+def _cached_headers_valid(session: requests.Session, program_id: str, headers: dict) -> bool:
+    url = f"https://ssg.adobe.io/api/program/{program_id}/repositories"
+    try:
+        response = session.head(url, headers=headers, timeout=10)
+    except requests.exceptions.RequestException:
+        return False
+    return response.status_code not in (401, 403)
+
+
+def get_auth_headers(session: requests.Session, program_id: str, fresh_login: bool = False) -> tuple:
+    """Returns (headers, from_cache)"""
+    if not fresh_login:
+        for cached in _load_cached_headers(program_id):
+            if _cached_headers_valid(session, program_id, cached):
+                print_section("Step 1: Browser Authentication")
+                print_success("Reusing cached authentication headers (use --fresh-login to sign in again)")
+                return cached, True
+    
+    # The pooled connection is ready by the time SSO finishes
+    warmer = prewarm_connection(session)
+    headers = capture_auth_headers(program_id)
+    warmer.join(timeout=1)
+    return headers, False
+
+
+def _ssg_url(href: str) -> str:
+    return href if href.startswith("http") else f"https://ssg.adobe.io{href}"
+
+
+class AuthenticationError(Exception):
+    """The SSG API rejected the session's headers with 401/403"""
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"Authentication failed (status {status_code})")
+        self.status_code = status_code
+
+
+def report_auth_failure(status_code: int):
+    print_error(f"Authentication failed (status {status_code})")
+    print_info("You need to request Cloud Manager SRE role on Slack:")
+    print_info("https://adobe.enterprise.slack.com/archives/C0648EGB1FY")
+    sys.exit(1)
+
+
+def _fetch_repository_page(session: requests.Session, url: str) -> dict:
+    response = session.get(url, timeout=30)
+    
+    if response.status_code in [401, 403]:
+        raise AuthenticationError(response.status_code)
+    
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+def _page_repositories(data: dict) -> list:
+    """Project a page's repositories down to REPOSITORY_FIELDS, dropping per-repo links and metadata"""
+    return [
+        {field: repo[field] for field in REPOSITORY_FIELDS if field in repo}
+        for repo in data.get("_embedded", {}).get("repositories", [])
+    ]
+
+
+def _remaining_page_urls(first_page: dict, page_limit: int):
+    """
+    Derive the URLs of pages 2..N from the HAL `last` link, or return None
+    when the response does not expose one (callers then follow `next` links).
+    """
+    last_href = first_page.get("_links", {}).get("last", {}).get("href")
+    if not last_href:
+        return None
+    
+    last_url = urlparse(_ssg_url(last_href))
+    query = parse_qs(last_url.query)
+    try:
+        last_start = int(query["start"][0])
+        limit = int(query.get("limit", [page_limit])[0])
+    except (KeyError, ValueError):
+        return None
+    
+    urls = []
+    for start in range(limit, last_start + 1, limit):
+        query["start"] = [str(start)]
+        urls.append(urlunparse(last_url._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+
+@lru_cache(maxsize=8)
+def _primary_pattern(program_id: str) -> re.Pattern:
+    return re.compile(rf'^[^-]+-p{program_id}(?:-uk\d+)?$')
+
+
+def _find_primary_match(repositories: list, primary_pattern: re.Pattern):
+    """First ready, non-excluded repository whose name matches the primary pattern"""
+    for repo in repositories:
+        repo_name = repo.get("repo", "")
+        if repo.get("status", "") != "ready":
+            continue
+        if _EXCLUDE_RE.search(repo_name):
+            continue
+        if primary_pattern.match(repo_name):
+            return repo
+    return None
+
+
+def fetch_repositories(program_id: str, session: requests.Session, stop_at_first_match: bool = True) -> list:
     print_section("Step 2: Fetching Repositories")
     
     base_url = f"https://ssg.adobe.io/api/program/{program_id}/repositories"
     all_repositories = []
-    url = base_url
     page_limit = 20
+    primary_pattern = _primary_pattern(program_id)
     
-    while url:
-        print_info(f"Fetching: {url}")
+    try:
+        print_info(f"Fetching: {base_url}")
+        data = _fetch_repository_page(session, base_url)
+        repositories = _page_repositories(data)
+        all_repositories.extend(repositories)
         
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            
-            if response.status_code in [401, 403]:
-                print_error(f"Authentication failed (status {response.status_code})")
-                print_info("You need to request Cloud Manager SRE role on Slack:")
-                print_info("https://adobe.enterprise.slack.com/archives/C0648EGB1FY")
-                sys.exit(1)
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            repositories = data.get("_embedded", {}).get("repositories", [])
-            all_repositories.extend(repositories)
-            
-            if DEBUG:
-                print_success(f"Fetched {len(repositories)} repositories (total: {len(all_repositories)})")
-            
-            if len(repositories) < page_limit:
-                if DEBUG:
-                    print_info("Reached end of results (page not full)")
-                break
-            
+        if stop_at_first_match and _find_primary_match(repositories, primary_pattern):
+            # filter_repositories picks the first primary match, so later pages can't change the result
+            print_info("Matching repository found on the first page, skipping remaining pages")
+            page_urls = []
+        elif len(repositories) >= page_limit:
+            page_urls = _remaining_page_urls(data, page_limit)
+        else:
+            page_urls = []
+        
+        if page_urls:
+            # Total page count is known up front: fetch the remaining pages concurrently
+            print_info(f"Fetching {len(page_urls)} more pages in parallel...")
+            pages = [None] * len(page_urls)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(_fetch_repository_page, session, u): i for i, u in enumerate(page_urls)}
+                for future in as_completed(futures):
+                    pages[futures[future]] = future.result()
+            for page in pages:
+                all_repositories.extend(_page_repositories(page))
+        elif page_urls is None:
+            # No `last` link: follow `next` links one page at a time
+            url = None
             next_link = data.get("_links", {}).get("next", {}).get("href")
             if next_link:
-                url = f"https://ssg.adobe.io{next_link}" if not next_link.startswith("http") else next_link
-            else:
-                url = None
+                url = _ssg_url(next_link)
+            
+            while url:
+                print_info(f"Fetching: {url}")
+                data = _fetch_repository_page(session, url)
                 
-        except requests.exceptions.RequestException as e:
-            print_error(f"Failed to fetch repositories: {e}")
-            sys.exit(1)
+                repositories = _page_repositories(data)
+                all_repositories.extend(repositories)
+                
+                if DEBUG:
+                    print_success(f"Fetched {len(repositories)} repositories (total: {len(all_repositories)})")
+                
+                if stop_at_first_match and _find_primary_match(repositories, primary_pattern):
+                    print_info("Matching repository found, skipping remaining pages")
+                    break
+                
+                if len(repositories) < page_limit:
+                    if DEBUG:
+                        print_info("Reached end of results (page not full)")
+                    break
+                
+                next_link = data.get("_links", {}).get("next", {}).get("href")
+                url = _ssg_url(next_link) if next_link else None
+    
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print_error(f"Failed to fetch repositories: {e}")
+        sys.exit(1)
     
     print_success(f"Total repositories found: {len(all_repositories)}")
     return all_repositories
 
 
-def filter_repositories(repositories: list, program_id: str) -> dict:
+def filter_repositories(repositories: list, program_id: str, all_matches: bool = False) -> list:
     print_section("Step 3: Filtering Repositories")
     
     if not repositories:
@@ -336,14 +677,11 @@ def filter_repositories(repositories: list, program_id: str) -> dict:
     
     if len(repositories) == 1:
         print_info("Only one repository found, selecting it")
-        return repositories[0]
+        return [repositories[0]]
     
     print_info(f"Filtering {len(repositories)} repositories...")
     
-    primary_pattern = re.compile(rf'^[^-]+-p{program_id}(?:-uk\d+)?$')
-    fallback_pattern = re.compile(r'^[^-]+-aem-cloud$')
-    
-    exclude_keywords = ['config', 'dispatcher', 'qa', 'stage', 'dev']
+    primary_pattern = _primary_pattern(program_id)
     
     filtered = []
     for repo in repositories:
@@ -353,7 +691,7 @@ def filter_repositories(repositories: list, program_id: str) -> dict:
         if status != "ready":
             continue
         
-        if any(keyword in repo_name.lower() for keyword in exclude_keywords):
+        if _EXCLUDE_RE.search(repo_name):
             continue
         
         if primary_pattern.match(repo_name):
@@ -361,14 +699,18 @@ def filter_repositories(repositories: list, program_id: str) -> dict:
             print_info(f"  Matched: {repo_name}")
     
     if filtered:
+        if all_matches:
+            print_success(f"Selected {len(filtered)} matching repositories")
+            return filtered
+        
         if len(filtered) > 1:
-            print_warning(f"Multiple matching repositories found ({len(filtered)}), using first:")
+            print_warning(f"Multiple matching repositories found ({len(filtered)}), using first (pass --all-matches to clone all):")
             for r in filtered:
                 print(f"    - {r.get('repo')}")
         
         selected = filtered[0]
         print_success(f"Selected repository: {selected.get('repo')}")
-        return selected
+        return [selected]
     
     print_warning("No repositories matched primary pattern, trying fallback pattern...")
     
@@ -379,9 +721,9 @@ def filter_repositories(repositories: list, program_id: str) -> dict:
         if status != "ready":
             continue
         
-        if fallback_pattern.match(repo_name):
+        if _FALLBACK_PATTERN.match(repo_name):
             print_success(f"Selected repository (fallback): {repo_name}")
-            return repo
+            return [repo]
     
     print_error("No suitable repositories found after filtering")
     print_info("Available repositories:")
@@ -390,23 +732,20 @@ def filter_repositories(repositories: list, program_id: str) -> dict:
     sys.exit(1)
 
 
-def get_clone_command(program_id: str, repository_id: str, headers: dict) -> str:
+def get_clone_command(program_id: str, repository_id: str, session: requests.Session) -> str:
     print_section("Step 4: Getting Clone Command")
     
     url = f"https://ssg.adobe.io/api/program/{program_id}/repository/{repository_id}/commands"
     print_info(f"Fetching clone command from: {url}")
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = session.get(url, timeout=30)
         
         if response.status_code in [401, 403]:
-            print_error(f"Authentication failed (status {response.status_code})")
-            print_info("You need to request Cloud Manager SRE role on Slack:")
-            print_info("https://adobe.enterprise.slack.com/archives/C0648EGB1FY")
-            sys.exit(1)
+            report_auth_failure(response.status_code)
         
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
         clone_command = data.get("clone")
         if not clone_command:
@@ -416,41 +755,69 @@ def get_clone_command(program_id: str, repository_id: str, headers: dict) -> str
         print_success("Clone command retrieved")
         return clone_command
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         print_error(f"Failed to get clone command: {e}")
         sys.exit(1)
 
 
-def clone_repository(clone_command: str, target_dir: str):
+def build_clone_argv(clone_command: str, target_dir: str):
+    """
+    Turn the API's clone command into an argv list that runs in target_dir via
+    `git -C`, adding shallow/partial clone flags unless CLONE_FULL_HISTORY=1 is set.
+    Returns None when the command is not a plain `git ... clone` invocation
+    (env assignments, `cd x && ...`, unbalanced quotes); the caller then runs it
+    unchanged through the shell in target_dir.
+    """
+    try:
+        argv = shlex.split(clone_command)
+    except ValueError:
+        return None
+    
+    if not argv or os.path.basename(argv[0]) != "git" or "clone" not in argv[1:]:
+        return None
+    clone_index = argv.index("clone", 1)
+    
+    fast_flags = []
+    if os.getenv("CLONE_FULL_HISTORY") != "1":
+        fast_flags = ["--depth=1", "--filter=blob:none", "--single-branch", f"--jobs={os.cpu_count() or 4}"]
+        if "--recurse-submodules" in argv or any(a.startswith("--recurse-submodules=") for a in argv):
+            fast_flags.append("--shallow-submodules")
+    
+    # posix_spawn needs an executable path with a directory part
+    git = argv[0] if os.path.dirname(argv[0]) else (shutil.which("git") or "git")
+    return (
+        [git, "-C", str(target_dir)]
+        + argv[1:clone_index + 1] + fast_flags + argv[clone_index + 1:]
+    )
+
+
+def clone_repository(clone_command: str, target_dir: str, clone_timeout: int = 1800):
     print_section("Step 5: Cloning Repository")
     
     target_path = Path(target_dir)
+    clone_argv = build_clone_argv(clone_command, str(target_path))
     
     print_info(f"Target directory: {target_path}")
-    print_info(f"Command: {clone_command}")
+    print_info(f"Command: {shlex.join(clone_argv) if clone_argv else clone_command}")
     
     try:
-        result = subprocess.run(
-            clone_command,
-            shell=True,
-            cwd=str(target_path),
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
+        # No output capture: git's progress goes straight to the terminal
+        if clone_argv:
+            # git -C selects the directory, so no cwd; with close_fds=False Popen can
+            # use posix_spawn (the fds Python opens are non-inheritable, so nothing leaks)
+            result = subprocess.run(clone_argv, close_fds=False, timeout=clone_timeout)
+        else:
+            # Not a plain git clone: run it as the API returned it
+            result = subprocess.run(clone_command, shell=True, cwd=str(target_path), timeout=clone_timeout)
         
         if result.returncode == 0:
             print_success("Repository cloned successfully!")
-            if result.stdout:
-                print(result.stdout)
         else:
             print_error(f"Clone failed with exit code {result.returncode}")
-            if result.stderr:
-                print(result.stderr)
             sys.exit(1)
             
     except subprocess.TimeoutExpired:
-        print_error("Clone operation timed out (5 minutes)")
+        print_error(f"Clone operation timed out after {clone_timeout}s (set CLONE_TIMEOUT to raise the limit)")
         sys.exit(1)
     except Exception as e:
         print_error(f"Failed to execute clone command: {e}")
@@ -469,6 +836,15 @@ Examples:
   # Use PROGRAM_ID from .env file
   python customer_repo_clone.py
 
+  # Ignore cached authentication headers and sign in again
+  python customer_repo_clone.py --fresh-login
+
+  # Clone every matching repository (e.g. uk mirrors), two at a time
+  python customer_repo_clone.py --all-matches --max-parallel-clones 2
+
+  # Keep a browser running so later invocations skip the Chromium cold start
+  python customer_repo_clone.py --daemon
+
 Configuration:
   CENTRAL_REPO_DIR must be set in .env file to specify where repos should be cloned.
   PROGRAM_ID can be set in .env file to avoid passing --program-id argument.
@@ -486,8 +862,37 @@ Requirements:
         help="Adobe Cloud Manager program ID (uses PROGRAM_ID from .env if not provided)"
     )
     
+    parser.add_argument(
+        "--fresh-login",
+        action="store_true",
+        help="Ignore cached authentication headers and sign in through the browser again"
+    )
+    
+    parser.add_argument(
+        "--all-matches",
+        action="store_true",
+        help="Clone every repository matching the primary pattern instead of only the first"
+    )
+    
+    parser.add_argument(
+        "--max-parallel-clones",
+        type=int,
+        default=None,
+        help="Maximum concurrent clones with --all-matches (default: min(4, number of matches))"
+    )
+    
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=f"Run a persistent browser on port {BROWSER_DEBUG_PORT} that later invocations attach to"
+    )
+    
     args = parser.parse_args()
     
+    if args.daemon:
+        run_browser_daemon()
+        return
+    
     print_section("Customer Repository Clone Tool")
     
     load_env_file()
@@ -505,26 +910,53 @@ Requirements:
     
     print_info(f"Using Program ID: {program_id}")
     
-    headers = capture_auth_headers(program_id)
-    
-    repositories = fetch_repositories(program_id, headers)
-    
-    selected_repo = filter_repositories(repositories, program_id)
-    
-    print_info(f"Repository ID: {selected_repo.get('id')}")
-    print_info(f"Repository Name: {selected_repo.get('repo')}")
-    print_info(f"Repository URL: {selected_repo.get('repositoryUrl')}")
+    session = create_http_session()
+    headers, from_cache = get_auth_headers(session, program_id, fresh_login=args.fresh_login)
+    session.headers.update(headers)
     
-    clone_command = get_clone_command(
-        program_id,
-        selected_repo.get('id'),
-        headers
-    )
-    
-    clone_repository(clone_command, config["central_repo_dir"])
+    try:
+        repositories = fetch_repositories(program_id, session, stop_at_first_match=not args.all_matches)
+    except AuthenticationError as e:
+        if not from_cache:
+            report_auth_failure(e.status_code)
+        
+        # The cached headers passed the HEAD probe but the real request rejected them
+        print_warning("Cached authentication headers were rejected, signing in again")
+        _header_cache_file(program_id, headers).unlink(missing_ok=True)
+        for name in headers:
+            session.headers.pop(name, None)
+        
+        headers, _ = get_auth_headers(session, program_id, fresh_login=True)
+        session.headers.update(headers)
+        try:
+            repositories = fetch_repositories(program_id, session, stop_at_first_match=not args.all_matches)
+        except AuthenticationError as e:
+            report_auth_failure(e.status_code)
+    
+    _save_cached_headers(program_id, headers)
+    
+    selected_repos = filter_repositories(repositories, program_id, all_matches=args.all_matches)
+    
+    for selected_repo in selected_repos:
+        print_info(f"Repository ID: {selected_repo.get('id')}")
+        print_info(f"Repository Name: {selected_repo.get('repo')}")
+        print_info(f"Repository URL: {selected_repo.get('repositoryUrl')}")
+    
+    # Each repository is fetched and cloned independently, so they can run side by side
+    max_workers = args.max_parallel_clones or min(4, len(selected_repos))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        clone_commands = list(executor.map(
+            lambda repo: get_clone_command(program_id, repo.get('id'), session),
+            selected_repos
+        ))
+        list(executor.map(
+            lambda command: clone_repository(command, config["central_repo_dir"], config["clone_timeout"]),
+            clone_commands
+        ))
     
     print_section("Complete")
-    print_success(f"Repository '{selected_repo.get('repo')}' cloned to {config['central_repo_dir']}")
+    for selected_repo in selected_repos:
+        print_success(f"Repository '{selected_repo.get('repo')}' cloned to {config['central_repo_dir']}")
 
 
 if __name__ == "__main__":